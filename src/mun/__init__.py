@@ -0,0 +1,2 @@
+# type: ignore
+from mun.prelude import *  # noqa: F401, F403
@@ -0,0 +1,120 @@
+"""
+Compiled kernels for bulk conversions.
+
+`numba` is optional: when it isn't installed `HAS_NUMBA` is `False` and callers should
+fall back to plain `numpy` operations.
+"""
+
+try:
+    import numpy as np
+    from numba import float64, int32, njit, prange
+    from numba.experimental import jitclass
+except ImportError:
+    HAS_NUMBA = False
+else:
+    HAS_NUMBA = True
+
+    # Arrays smaller than this are handled by `numpy`, since starting the parallel
+    # kernels' threads costs more than the loop itself
+    PARALLEL_MIN_SIZE = 8192
+
+    @njit(cache=True, parallel=True)
+    def _affine_kernel(values, scale, offset, out):  # pragma: no cover
+        for i in prange(values.size):
+            out[i] = values[i] * scale + offset
+
+    def affine(
+        values: np.ndarray,
+        scale: float,
+        offset: float,
+        out: np.ndarray | None = None,
+    ) -> np.ndarray:
+        """
+        Computes `values * scale + offset` in a single compiled loop.
+
+        # Note
+        `values` (and `out`, if given) must be C-contiguous. Arrays smaller than
+        `PARALLEL_MIN_SIZE` are computed with `numpy` instead.
+        """
+        if values.size < PARALLEL_MIN_SIZE:
+            out = np.multiply(values, scale, out=out)
+            if offset:
+                out += offset
+            return out
+
+        if out is None:
+            out = np.empty(values.shape, np.result_type(values, 1.0))
+        _affine_kernel(values.reshape(-1), scale, offset, out.reshape(-1))
+        return out
+
+    @njit(cache=True, parallel=True)
+    def _add_kernel(a, b, scale, offset, out):  # pragma: no cover
+        for i in prange(a.size):
+            out[i] = a[i] + b[i] * scale + offset
+
+    def scaled_add(
+        a: np.ndarray, b: np.ndarray, scale: float, offset: float
+    ) -> np.ndarray:
+        """
+        Computes `a + b * scale + offset` in a single compiled loop, without any
+        intermediate arrays.
+
+        # Note
+        `a` and `b` must be C-contiguous and have the same shape. Arrays smaller than
+        `PARALLEL_MIN_SIZE` are computed with `numpy` instead.
+        """
+        if a.size < PARALLEL_MIN_SIZE:
+            out = np.add(a, np.multiply(b, scale))
+            if offset:
+                out += offset
+            return out
+
+        out = np.empty(a.shape, np.result_type(a, b, 1.0))
+        _add_kernel(a.reshape(-1), b.reshape(-1), scale, offset, out.reshape(-1))
+        return out
+
+    def measurement_jit(factors: np.ndarray) -> type:
+        """
+        Compiles a `Measurement` whose unit is a unit type `ID` and whose arithmetic
+        runs as native code.
+
+        # Inputs:
+            factors - The conversion factors between every pair of unit types:
+                      `factors[src, dst]` converts a value in `src` into `dst`.
+
+        # Note
+        `factors` is frozen into the compiled class. Units that can't be converted into
+        each other have a `nan` factor, so combining or converting them gives `nan`
+        rather than raising.
+        """
+
+        @jitclass([("value", float64), ("unit_idx", int32)])
+        class MeasurementJIT:  # pragma: no cover
+            def __init__(self, value, unit_idx):
+                self.value = value
+                self.unit_idx = unit_idx
+
+            def to(self, unit_idx):
+                return MeasurementJIT(
+                    self.value * factors[self.unit_idx, unit_idx], unit_idx
+                )
+
+            def __add__(self, other):
+                return MeasurementJIT(
+                    self.value + other.value * factors[other.unit_idx, self.unit_idx],
+                    self.unit_idx,
+                )
+
+            def __sub__(self, other):
+                return MeasurementJIT(
+                    self.value - other.value * factors[other.unit_idx, self.unit_idx],
+                    self.unit_idx,
+                )
+
+            def __mul__(self, scalar):
+                return MeasurementJIT(self.value * scalar, self.unit_idx)
+
+            def __truediv__(self, scalar):
+                return MeasurementJIT(self.value / scalar, self.unit_idx)
+
+        return MeasurementJIT
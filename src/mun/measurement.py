@@ -1,9 +1,105 @@
 from __future__ import annotations
-from mun.units import Unit, UnitOps, ureg
+import operator
+import sys
+from numbers import Number
+from functools import cache, lru_cache
+from typing import TYPE_CHECKING, Any, Callable, Iterable, Iterator, TypeGuard
+from mun.units import (
+    Registry,
+    Unit,
+    _div_unit,
+    _factor_table,
+    _load_fastpath,
+    _mul_unit,
+    _pow_unit,
+    convert_array,
+    get_conversion,
+    get_factor,
+)
+
+if TYPE_CHECKING:
+    import numpy as np
+
+
+def _resolve_unit(unit: Unit | str) -> Unit:
+    """
+    Gets the unit that `unit` refers to, including for subclasses of `Unit` and `str`.
+
+    Raises a `KeyError` for unregistered names, and a `TypeError` for anything else
+    that isn't a unit.
+    """
+    if isinstance(unit, str):
+        found = Registry._by_name.get(str(unit))
+        if found is None:
+            raise KeyError(f"no unit named {unit!r} is registered")
+        return found
+    elif isinstance(unit, Unit):
+        return unit
+    else:
+        raise TypeError("`unit` must be a `Unit` or a `str`")
+
+
+@lru_cache(maxsize=4096)
+def _format(value: float, suffix: str) -> str:
+    """Formats a measurement's value and unit suffix (see `Measurement.__str__`)."""
+    return str(value) + suffix
+
+
+def _is_number(other: object) -> TypeGuard[float | np.ndarray]:
+    """
+    Checks if `other` is a plain number (or a `numpy` array), which scales or offsets a
+    measurement's value as is.
+    """
+    if type(other) is float or type(other) is int or isinstance(other, Number):
+        return True
+    # `numpy` is only checked for if it's been imported
+    np = sys.modules.get("numpy")
+    return np is not None and isinstance(other, np.ndarray)
+
+
+def _is_compatible(a: Unit, b: Unit) -> bool:
+    """
+    Checks if `a` and `b` have the same dimensions, or the same kind if either unit's
+    dimensions aren't known.
+    """
+    if a.exp is not None and b.exp is not None:
+        return a.exp == b.exp
+    # `Unit` interns its kind, so identity is equality here
+    return a.kind is b.kind
+
+
+@lru_cache(maxsize=1024)
+def _combiner(
+    dst: Unit, src: Unit, op: Callable[[Any, Any], Any]
+) -> Callable[[Any, Any], Any]:
+    """
+    Builds a function that adds or subtracts (`op`) a value in `src` from a value in
+    `dst`, giving a value in `dst`.
+
+    The units are checked, and the conversion between them is folded into constants,
+    once per pair of units.
+    """
+    if not _is_compatible(dst, src):
+        raise TypeError(f"`other` must be a unit of {dst.kind}")
+    if dst.scale_to_base is None or src.scale_to_base is None:
+        raise TypeError(
+            "`self` and `other` must have units with `scale_to_base` defined"
+        )
+
+    if dst.is_linear and src.is_linear:
+        factor = get_factor(src, dst)
+        scale = factor if op is operator.add else -factor
+        return lambda a, b: a + b * scale
+
+    # The conversions into and out of the base unit are inlined
+    dst_scale, dst_offset = dst.scale_to_base, dst.offset_to_base
+    src_scale, src_offset = src.scale_to_base, src.offset_to_base
+    return lambda a, b: (
+        (op(a * dst_scale + dst_offset, b * src_scale + src_offset) - dst_offset)
+        / dst_scale
+    )
 
 
-# TODO: Add `to` and `from_` methods
-#
 # TODO: Add `reduce` and `expand` methods
 class Measurement[T]:
     """
@@ -13,10 +109,26 @@ class Measurement[T]:
     class doesn't reference it in any way.
 
     # Note
-    Units created by multiplying (`__mul__`) or dividing (`__div__`) units together will not have valid `to_base` and `from_base` methods.
-        - To implement that functionality, create a custom unit.
+    Units created by multiplying (`__mul__`) or dividing (`__div__`) units together
+    derive their `scale_to_base` and `exp` from their components.
+        - They can be converted into any unit with the same dimensions (e.g. `km*km`
+          into `m^2`).
+
+    The value can also be a `numpy` array (see `from_array`): arithmetic then works
+    element-wise, and `__str__` prints the array as `str` does, followed by the unit.
+
+    For tight numeric loops, `mun.measurement.MeasurementJIT` is a `numba`-compiled
+    variant whose unit is a unit type `ID` (e.g. `Kilometer.ID`).
     """
 
+    __slots__ = ("value", "unit")
+    value: float | np.ndarray
+    unit: Unit
+
+    def __class_getitem__(cls, item: object) -> type[Measurement]:
+        # The unit type is only bookkeeping: `Measurement[Meter]` is `Measurement`
+        return cls
+
     def from_[U](self, measurement: Measurement[U]) -> Measurement[T]:
         """
         Creates a new measurement from the given one.
@@ -27,187 +139,173 @@ class Measurement[T]:
         """
         return Measurement(measurement.value, self.unit)
 
+    @classmethod
+    def from_array(
+        cls, values: Iterable[float] | np.ndarray, unit: Unit | str
+    ) -> Measurement[T]:
+        """
+        Creates a measurement of many values in the same unit, stored as a `numpy` array.
+
+        # Note
+        `numpy` must be installed.
+        """
+        import numpy as np
+
+        return cls(np.asarray(values, dtype=np.float64), unit)
+
     # TODO: incorporate `from_` into `__init__`
-    def __init__(self, value: float, unit: Unit | str):
+    def __init__(self, value: float | np.ndarray, unit: Unit | str):
         """
         Creates a new measurement with the given value and unit.
 
         # Inputs:
-            value   - The actual measurement value.
+            value   - The actual measurement value (a number or a `numpy` array).
             unit    - A `Unit`, or a string representing a unit registered in the `Registry`.
+
+        # Note
+        Raises a `KeyError` if `unit` is a string that isn't a registered name or alias.
         """
 
-        self.value: float = value
+        self.value = value
 
-        if isinstance(unit, Unit):
+        if type(unit) is Unit:
             self.unit = unit
 
         # Match unit to name/aliases in registry
-        if isinstance(unit, str):
-            for id in ureg.units:
-                if id.name == unit:
-                    self.unit = ureg.units[id]
-                    return
-                elif id.aliases and unit in id.aliases:
-                    self.unit = ureg.units[id]
-                    return
+        elif type(unit) is str and (found := Registry._by_name.get(unit)) is not None:
+            self.unit = found
+        else:
+            self.unit = _resolve_unit(unit)
+
+    def to[U](self, unit: Unit | str) -> Measurement[U]:
+        """
+        Converts the measurement into the given unit.
+
+        # Inputs:
+            unit    - A `Unit`, or a string representing a unit registered in the `Registry`.
+
+        Measurements of `numpy` arrays are converted with vectorized array operations.
+        """
+        converted = Measurement[U](self.value, unit)
+        src, dst = self.unit, converted.unit
+        if not _is_compatible(src, dst):
+            raise TypeError(f"`unit` must be a unit of {src.kind}")
+        if src.scale_to_base is None or dst.scale_to_base is None:
+            raise TypeError(
+                "`self` and `unit` must have units with `scale_to_base` defined"
+            )
+
+        # `numpy` is only checked for if it's been imported (i.e. `value` may be an array)
+        np = sys.modules.get("numpy")
+        if np is not None and isinstance(self.value, np.ndarray):
+            converted.value = convert_array(self.value, src, dst)  # type: ignore
+        elif dst is not src:
+            scale, offset = get_conversion(src, dst)
+            converted.value = self.value * scale + offset
+        return converted
 
     def __str__(self) -> str:
-        if self.unit.symbol:
-            return f"{self.value} {self.unit.symbol}"
+        value = self.value
+        # Only non-zero floats are cached: a NaN never matches its own cache entry, and
+        # `-0.0` would hit the entry for `0.0`
+        if type(value) is float and value and value == value:
+            return _format(value, self.unit._suffix)
+        return str(value) + self.unit._suffix
+
+    def _linop(
+        self, other: Measurement | float, op: Callable[[Any, Any], Any]
+    ) -> Measurement[T]:
+        """
+        Adds or subtracts (`op`) `other` from the measurement, in the measurement's unit.
+        """
+        # The units are read once up front since every branch needs them
+        unit = self.unit
+        if type(other) is Measurement:
+            other_unit = other.unit
+
+            # Values in the same unit are combined directly (unless the unit has an
+            # offset, which is applied in the base unit)
+            if other_unit is unit and not unit.offset_to_base:
+                return Measurement(op(self.value, other.value), unit)
+            return Measurement(
+                _combiner(unit, other_unit, op)(self.value, other.value), unit
+            )
+        elif _is_number(other):
+            return Measurement(op(self.value, other), unit)
         else:
-            return f"{self.value} {self.unit.__ne__}"
+            return NotImplemented
 
     def __add__(self, other: Measurement | float) -> Measurement[T]:
-        if isinstance(other, Measurement):
-            if self.unit.kind == other.unit.kind:
-                if (
-                    self.unit.to_base is not None
-                    and other.unit.to_base is not None
-                    and self.unit.from_base
-                ):
-                    base_value = self.unit.to_base(self.value) + other.unit.to_base(  # type: ignore
-                        other.value
-                    )
-                    return Measurement(self.unit.from_base(base_value), self.unit)
-                else:
-                    raise TypeError(
-                        "`self` and `other` must have units with `to_base` and `from_base` methods defined"
-                    )
-            else:
-                raise TypeError(f"`other` must be a unit of {self.unit.kind}")
-        else:
-            return Measurement(self.value + other, self.unit)
+        return self._linop(other, operator.add)
 
     def __sub__(self, other: Measurement | float) -> Measurement[T]:
-        if isinstance(other, Measurement):
-            if self.unit.kind == other.unit.kind:
-                if (
-                    self.unit.to_base is not None
-                    and other.unit.to_base is not None
-                    and self.unit.from_base
-                ):
-                    base_value = self.unit.to_base(self.value) - other.unit.to_base(  # type: ignore
-                        other.value
-                    )
-                    return Measurement(self.unit.from_base(base_value), self.unit)
-                else:
-                    raise TypeError(
-                        "`self` and `other` must have units with `to_base` and `from_base` methods defined"
-                    )
-            else:
-                raise TypeError(f"`other` must be a unit of {self.unit.kind}")
-        else:
-            return Measurement(self.value - other, self.unit)
-
-    def _get_unit(self, symbol: str) -> Unit | None:  # type: ignore
-        """
-        Gets a unit matching the symbol from the registry if one exists.
-        """
-        for id in ureg.units:
-            if id.name == symbol:
-                unit = ureg.units[id]
-                return unit
-            elif id.aliases and symbol in id.aliases:
-                unit = ureg.units[id]
-                return unit
-            else:
-                return None
+        return self._linop(other, operator.sub)
 
     def __mul__(self, other: Measurement | float) -> Measurement:
-        if isinstance(other, Measurement):
-            symbol = self.unit.symbol + "*" + other.unit.symbol
-            kind = self.unit.kind + "*" + other.unit.kind
-            unit: Unit | None = self._get_unit(symbol)
-
-            # Create new unit if one doesn't exist
-            if unit is None:
-                unit = Unit(
-                    symbol=symbol,
-                    kind=kind,
-                    to_base=None,
-                    from_base=None,
-                    components=[self.unit.symbol, other.unit.symbol],
-                    ops=[UnitOps.Mul],
-                )
-
-            return Measurement(self.value * other.value, unit)
-        else:
+        if type(other) is Measurement:
+            return Measurement(
+                self.value * other.value, _mul_unit(self.unit, other.unit)
+            )
+        elif _is_number(other):
             return Measurement(self.value * other, self.unit)
+        else:
+            return NotImplemented
 
     def __div__(self, other: Measurement | float) -> Measurement:
-        if isinstance(other, Measurement):
-            symbol = self.unit.symbol + "/" + other.unit.symbol
-            kind = self.unit.kind + "/" + other.unit.kind
-            unit: Unit | None = self._get_unit(symbol)
-
-            # Create new unit if one doesn't exist
-            if unit is None:
-                unit = Unit(
-                    symbol=symbol,
-                    kind=kind,
-                    to_base=None,
-                    from_base=None,
-                    components=[self.unit.symbol, other.unit.symbol],
-                    ops=[UnitOps.Div],
-                )
-
-            return Measurement(self.value / other.value, unit)
-        else:
+        if type(other) is Measurement:
+            return Measurement(
+                self.value / other.value, _div_unit(self.unit, other.unit)
+            )
+        elif _is_number(other):
             return Measurement(self.value / other, self.unit)
+        else:
+            return NotImplemented
 
     def __pow__(self, exp: int) -> Measurement:
-        symbol = f"{self.unit.symbol}^{exp}"
-        unit: Unit | None = self._get_unit(symbol)
-
-        # Create new unit if one doesn't exist
-        if unit is None:
-            unit = Unit(
-                symbol=symbol,
-                kind="",
-                to_base=None,
-                from_base=None,
-                components=[self.unit.symbol for _ in range(exp)],
-                ops=[UnitOps.Div],
-            )
-
-        return Measurement(self.value**exp, unit)
+        return Measurement(self.value**exp, _pow_unit(self.unit, exp))
 
     def __eq__(self, other: object) -> bool:
-        if isinstance(other, Measurement):
+        if type(other) is Measurement:
             return self.unit == other.unit and self.value == other.value
-        else:
+        elif isinstance(other, (int, float)):
             return self.value == other
+        else:
+            return NotImplemented
 
     def __ne__(self, other: object) -> bool:
-        if isinstance(other, Measurement):
+        if type(other) is Measurement:
             return self.unit != other.unit or self.value != other.value
-        else:
+        elif isinstance(other, (int, float)):
             return self.value != other
+        else:
+            return NotImplemented
 
-    def __gt__(self, other: Measurement | float) -> bool:
-        if isinstance(other, Measurement):
-            return self.unit == other.unit and self.value > other.value
+    def __hash__(self) -> int:
+        # Only the value is hashed, since a measurement also equals a bare number
+        return hash(self.value)
+
+    def _cmp(self, other: Measurement | float, op: Callable[[Any, Any], bool]) -> bool:
+        """
+        Compares the measurement's value to `other` with `op`.
+
+        Measurements of different units are never ordered (the comparison is `False`).
+        """
+        if type(other) is Measurement:
+            return self.unit == other.unit and op(self.value, other.value)
         else:
-            return self.value > other
+            return op(self.value, other)
+
+    def __gt__(self, other: Measurement | float) -> bool:
+        return self._cmp(other, operator.gt)
 
     def __ge__(self, other: Measurement | float) -> bool:
-        if isinstance(other, Measurement):
-            return self.unit == other.unit and self.value >= other.value
-        else:
-            return self.value >= other
+        return self._cmp(other, operator.ge)
 
     def __lt__(self, other: Measurement | float) -> bool:
-        if isinstance(other, Measurement):
-            return self.unit == other.unit and self.value < other.value
-        else:
-            return self.value < other
+        return self._cmp(other, operator.lt)
 
     def __le__(self, other: Measurement | float) -> bool:
-        if isinstance(other, Measurement):
-            return self.unit == other.unit and self.value <= other.value
-        else:
-            return self.value <= other
+        return self._cmp(other, operator.le)
 
     __ladd__ = __add__
     __radd__ = __add__
@@ -228,3 +326,177 @@ class Measurement[T]:
         Checks if the measurement is the specifed `kind`
         """
         return self.unit.kind == kind
+
+
+class MeasurementArray[T]:
+    """
+    Represents many measurements of the same unit, stored as one `numpy` array.
+
+    The arithmetic and conversions are the same as `Measurement`'s, but run over the
+    whole array at once. Indexing or iterating gives back `Measurement`s (or, for arrays
+    of more than one dimension, `MeasurementArray`s of the rows).
+
+    # Note
+    Requires `numpy`.
+    """
+
+    __slots__ = ("values", "unit")
+
+    def __class_getitem__(cls, item: object) -> type[MeasurementArray]:
+        return cls
+
+    def __init__(self, values: Iterable[float] | np.ndarray, unit: Unit | str):
+        """
+        Creates a new array of measurements with the given values and unit.
+
+        # Inputs:
+            values  - The measurement values (converted into a `float64` array).
+            unit    - A `Unit`, or a string representing a unit registered in the `Registry`.
+        """
+        import numpy as np
+
+        self.values = np.asarray(values, dtype=np.float64)
+        self.unit = _resolve_unit(unit)
+
+    def to[U](self, unit: Unit | str) -> MeasurementArray[U]:
+        """
+        Converts every measurement into the given unit.
+        """
+        converted: Measurement[U] = Measurement(self.values, self.unit).to(unit)
+        # The value of a measurement of an array is always an array
+        return MeasurementArray(converted.value, converted.unit)  # type: ignore
+
+    def _apply(
+        self,
+        other: MeasurementArray | Measurement | float,
+        op: Callable[[Any, Any], Measurement],
+    ) -> MeasurementArray:
+        """
+        Applies the `Measurement` operator `op` to the whole array at once.
+        """
+        if type(other) is MeasurementArray:
+            other = Measurement(other.values, other.unit)
+        result = op(Measurement(self.values, self.unit), other)
+        return MeasurementArray(result.value, result.unit)  # type: ignore
+
+    def _rapply(
+        self, other: Measurement | float, op: Callable[[Any, Any], Any]
+    ) -> MeasurementArray:
+        """
+        Applies the operator `op` with `other` on the left, e.g. for `other - self`.
+
+        A `Measurement` keeps its unit (the result is in it); a plain number is combined
+        with the values as is, like `Measurement` does.
+        """
+        if type(other) is Measurement:
+            result = op(other, Measurement(self.values, self.unit))
+            return MeasurementArray(result.value, result.unit)
+        elif _is_number(other):
+            return MeasurementArray(op(other, self.values), self.unit)
+        else:
+            return NotImplemented
+
+    def _linop(
+        self, other: MeasurementArray | Measurement | float, sign: float
+    ) -> MeasurementArray:
+        """
+        Adds (`sign=1.0`) or subtracts (`sign=-1.0`) `other` from every measurement.
+
+        Arrays of the same shape are combined in a single compiled loop when `numba` is
+        installed.
+        """
+        op = operator.add if sign > 0 else operator.sub
+        fastpath = _load_fastpath()
+        if (
+            fastpath is None
+            or type(other) is not MeasurementArray
+            or other.values.shape != self.values.shape
+            or not (self.values.flags.c_contiguous and other.values.flags.c_contiguous)
+            or not _is_compatible(self.unit, other.unit)
+        ):
+            return self._apply(other, op)
+
+        scale, other_scale = self.unit.scale_to_base, other.unit.scale_to_base
+        if scale is None or other_scale is None:
+            return self._apply(other, op)
+
+        # Same as adding in the base unit: the offset of `self.unit` cancels out
+        values = fastpath.scaled_add(
+            self.values,
+            other.values,
+            sign * other_scale / scale,
+            sign * other.unit.offset_to_base / scale,
+        )
+        return MeasurementArray(values, self.unit)
+
+    def __add__(
+        self, other: MeasurementArray | Measurement | float
+    ) -> MeasurementArray:
+        return self._linop(other, 1.0)
+
+    def __radd__(self, other: Measurement | float) -> MeasurementArray:
+        return self._rapply(other, operator.add)
+
+    def __sub__(
+        self, other: MeasurementArray | Measurement | float
+    ) -> MeasurementArray:
+        return self._linop(other, -1.0)
+
+    def __rsub__(self, other: Measurement | float) -> MeasurementArray:
+        return self._rapply(other, operator.sub)
+
+    def __mul__(
+        self, other: MeasurementArray | Measurement | float
+    ) -> MeasurementArray:
+        return self._apply(other, operator.mul)
+
+    def __rmul__(self, other: Measurement | float) -> MeasurementArray:
+        return self._rapply(other, operator.mul)
+
+    def __truediv__(
+        self, other: MeasurementArray | Measurement | float
+    ) -> MeasurementArray:
+        return self._apply(other, operator.truediv)
+
+    def __rtruediv__(self, other: Measurement) -> MeasurementArray:
+        # A number divided by measurements would need the inverse of their unit
+        if type(other) is not Measurement:
+            return NotImplemented
+        return self._rapply(other, operator.truediv)
+
+    def __len__(self) -> int:
+        return len(self.values)
+
+    def __getitem__(self, index) -> Measurement | MeasurementArray:
+        values = self.values[index]
+        if values.ndim:
+            return MeasurementArray(values, self.unit)
+        return Measurement(float(values), self.unit)
+
+    def __iter__(self) -> Iterator[Measurement | MeasurementArray]:
+        # Like indexing, iterating goes over the first axis
+        if self.values.ndim > 1:
+            for row in self.values:
+                yield MeasurementArray(row, self.unit)
+        else:
+            for value in self.values:
+                yield Measurement(float(value), self.unit)
+
+    def __str__(self) -> str:
+        return str(self.values) + self.unit._suffix
+
+
+@cache
+def _measurement_jit() -> type:
+    """Compiles `MeasurementJIT` on first use."""
+    fastpath = _load_fastpath()
+    if fastpath is None:
+        raise ImportError("`MeasurementJIT` requires `numba`")
+    return fastpath.measurement_jit(_factor_table())
+
+
+def __getattr__(name: str):
+    # `MeasurementJIT` is only compiled when it's first used, since it needs `numba`
+    if name == "MeasurementJIT":
+        return _measurement_jit()
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
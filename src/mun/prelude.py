@@ -22,9 +22,14 @@ from mun.units import (
     Second,  # noqa: F401
     Unit,  # noqa: F401
     UnitInfo,  # noqa: F401
-    UnitOps,  # noqa: F401
+    MUL,  # noqa: F401
+    DIV,  # noqa: F401
     UnitType,  # noqa: F401
     Registry,  # noqa: F401
     ureg,  # noqa: F401
+    lookup,  # noqa: F401
+    find_units,  # noqa: F401
+    to_base_batch,  # noqa: F401
+    convert_batch,  # noqa: F401
 )
-from mun.measurement import Measurement
+from mun.measurement import Measurement, MeasurementArray
@@ -1,10 +1,34 @@
+import copy
+import math
+import pickle
+
+import pytest
+
 from mun.prelude import (
+    DIV,
+    MUL,
     BaseUnitType,
+    Hour,
+    Kilogram,
+    Kilometer,
+    KilometerSquared,
+    KiloUnitType,
     Measurement,
+    MeasurementArray,
     Meter,
+    MeterPerSecondSquared,
+    MiliUnitType,
+    Minute,
+    Newton,
+    Pascal,
     Registry,
     Unit,
     UnitInfo,
+    UnitType,
+    convert_batch,
+    find_units,
+    lookup,
+    to_base_batch,
 )
 
 units = Registry()
@@ -14,15 +38,84 @@ def test_create():
     len1 = Measurement(1.0, units.meter)
     assert len1.__str__() == "1.0 m"
 
+    with pytest.raises(AttributeError):
+        units.meter.symbol = "M"
+
     len2 = Measurement(1.0, "m")
     assert len2.__str__() == "1.0 m"
+    assert Measurement[Meter] is Measurement
 
     # Custom units
-    m2 = Unit("m^2", "area", BaseUnitType.to_base, BaseUnitType.from_base)
+    m2 = Unit("m^2", "area", BaseUnitType.SCALE_TO_BASE)
     units.add_unit(UnitInfo("meters squared", ["m2", "m^2"]), m2)
 
     area = Measurement(1.0, "m2")
     assert area.__str__() == "1.0 m^2"
+    assert units.units["meters squared"] is m2
+    assert UnitInfo("meter", ["m", "m", "metre"]).aliases == {"m", "metre"}
+
+    # Re-registering a built-in unit updates its named attribute
+    meter = units.meter
+    metre = Unit("m", "length", 1.0, exp=Meter.EXP)
+    units.add_unit(Meter.id, metre)
+    assert units.meter is metre and Measurement(1.0, "m").unit is metre
+    units.add_unit(Meter.id, meter)
+    assert units.meter is meter
+
+    # The built-in units can't be modified
+    with pytest.raises(TypeError):
+        Registry._builtin_units["meters squared"] = m2  # type: ignore
+
+
+def test_lookup():
+    assert lookup("meter") is Meter
+    assert lookup("km") is Kilometer
+    assert lookup("m/s^2") is MeterPerSecondSquared
+
+    with pytest.raises(KeyError):
+        lookup("furlong")
+
+    assert units.lookup("km") is units.kilometer
+    assert units.lookup("furlong") is None
+
+    with pytest.raises(KeyError):
+        Measurement(1.0, "furlong")
+    with pytest.raises(TypeError):
+        Measurement(1.0, 1.0)
+
+    class Symbol(str):
+        pass
+
+    assert Measurement(1.0, Symbol("km")).unit is units.kilometer
+
+    found = list(find_units("9.8 m/s^2 for 2.5min over 3 kilometers"))
+    assert found == [
+        ("m/s^2", MeterPerSecondSquared),
+        ("min", Minute),
+        ("kilometers", Kilometer),
+    ]
+
+
+def test_unit_types():
+    generic = {BaseUnitType, KiloUnitType, MiliUnitType}
+    pending = list(UnitType.__subclasses__())
+    while pending:
+        cls = pending.pop()
+        pending.extend(cls.__subclasses__())
+        if cls in generic:
+            continue
+
+        assert isinstance(cls.id, UnitInfo), cls
+        assert isinstance(cls.SCALE_TO_BASE, float), cls
+
+
+def test_components():
+    assert Newton.component_ids == (Kilogram.ID, MeterPerSecondSquared.ID)
+    assert Newton.op_bytes == bytes([MUL])
+    assert Meter.component_ids is None
+
+    assert KilometerSquared.SCALE_TO_BASE == 1000.0 * 1000.0
+    assert Pascal.SCALE_TO_BASE == 1.0
 
 
 # TODO: Add tests for rest of arithmetic (sub and div)
@@ -35,6 +128,9 @@ def test_add():
     add = len1 + len2
     assert add.__str__() == "2.0 m"
 
+    add = Measurement(1.0, "km") + len1
+    assert add.__str__() == "1.001 km"
+
     area1 = Measurement(1.0, "m2")
     area2 = Measurement(1.0, "m2")
 
@@ -47,20 +143,239 @@ def test_add():
     add = 1 + area1
     assert add.__str__() == "2.0 m^2"
 
+    # Units without a scale can still be added to themselves
+    count = Unit("count", "count", None)
+    add = Measurement(2.0, count) + Measurement(3.0, count)
+    assert add.__str__() == "5.0 count"
+
+    celsius = Unit("°C", "temperature", 1.0, 273.15)
+    assert units.kelvin.is_linear and not celsius.is_linear
+    add = Measurement(1.0, celsius) + Measurement(274.15, units.kelvin)
+    assert add.value == pytest.approx(275.15)
+
+
+def test_sub():
+    sub = Measurement(1.0, "km") - Measurement(1.0, units.meter)
+    assert sub.__str__() == "0.999 km"
+
+    sub = Measurement(3.0, units.meter) - 1
+    assert sub.__str__() == "2.0 m"
+
+    with pytest.raises(TypeError):
+        Measurement(1.0, units.meter) - Measurement(1.0, units.second)
+
+
+def test_to():
+    assert units.kilometer.to_base(2.0) == 2000.0
+    assert units.minute.from_base(120.0) == 2.0
+
+    len1 = Measurement(1.0, units.kilometer)
+    assert len1.to(units.meter).__str__() == "1000.0 m"
+    assert len1.to("m").to("km").__str__() == "1.0 km"
+
+    time = Measurement(2.0, "hr")
+    assert time.to("min").__str__() == "120.0 min"
+    assert time.to("hr").__str__() == "2.0 hr"
+
+    celsius = Unit("°C", "temperature", 1.0, 273.15)
+    temp = Measurement(300.0, units.kelvin).to(celsius)
+    assert temp.value == pytest.approx(26.85)
+
+
+def test_to_array():
+    np = pytest.importorskip("numpy")
+
+    values = np.array([1.0, 2.0, 3.0])
+    lens = Measurement(values, units.kilometer).to(units.meter)
+    assert np.array_equal(lens.value, [1000.0, 2000.0, 3000.0])
+    assert np.array_equal(values, [1.0, 2.0, 3.0])
+
+    grid = Measurement(np.ones((2, 2)), units.hour).to(units.minute)
+    assert np.array_equal(grid.value, np.full((2, 2), 60.0))
+    big = Measurement(np.arange(10_000.0), units.kilometer).to(units.meter)
+    assert np.array_equal(big.value, np.arange(10_000.0) * 1000)
+
+    # Strided arrays take the plain `numpy` path
+    strided = Measurement(np.arange(6.0)[::2], units.hour).to(units.minute)
+    assert np.array_equal(strided.value, [0.0, 120.0, 240.0])
+
+    ids = np.array([Meter.ID, Kilometer.ID, Hour.ID])
+    assert np.array_equal(to_base_batch(values, ids), [1.0, 2000.0, 10800.0])
+    dst = np.array([Kilometer.ID, Meter.ID, Minute.ID])
+    assert np.array_equal(convert_batch(values, ids, dst), [0.001, 2000.0, 180.0])
+    assert np.isnan(convert_batch(values, ids, np.array([Minute.ID] * 3))[0])
+    assert units.kilometer.idx == Kilometer.ID
+
+    assert np.array_equal(Kilometer.to_base_array(values), [1000.0, 2000.0, 3000.0])
+    assert np.array_equal(Kilometer.from_base_array(values), [0.001, 0.002, 0.003])
+
+    lens = Measurement.from_array([1.0, 2.0, 3.0], "km")
+    add = lens + Measurement(values, units.meter)
+    assert np.array_equal(add.value, [1.001, 2.002, 3.003])
+    assert (lens * lens).unit is units.kilometer_squared
+    assert (lens * 2).__str__() == "[2. 4. 6.] km"
+
+
+def test_measurement_array():
+    np = pytest.importorskip("numpy")
+
+    lens = MeasurementArray([1.0, 2.0, 3.0], "km")
+    assert lens.__str__() == "[1. 2. 3.] km"
+    assert len(lens) == 3
+
+    add = lens + MeasurementArray([1.0, 2.0, 3.0], units.meter)
+    assert np.array_equal(add.values, [1.001, 2.002, 3.003])
+    assert np.array_equal(lens.to("m").values, [1000.0, 2000.0, 3000.0])
+    assert (lens * lens).unit is units.kilometer_squared
+    assert np.array_equal((2 * lens).values, [2.0, 4.0, 6.0])
+
+    assert lens[1].__str__() == "2.0 km"
+    assert lens[1:].__str__() == "[2. 3.] km"
+    assert [m.value for m in lens] == [1.0, 2.0, 3.0]
+    grid = MeasurementArray(np.ones((2, 3)), "km")
+    assert [row.values.tolist() for row in grid] == [[1.0] * 3] * 2
+    assert all(row.unit is units.kilometer for row in grid)
+
+    # A measurement on the left keeps its unit
+    km = Measurement(1.0, "km")
+    lens_m = MeasurementArray([1000.0, 2000.0], units.meter)
+    for result, expected in (
+        (km + lens_m, [2.0, 3.0]),
+        (km - lens_m, [0.0, -1.0]),
+        (km * lens_m, [1000.0, 2000.0]),
+        (km / lens_m, [0.001, 0.0005]),
+    ):
+        assert type(result) is MeasurementArray
+        assert np.allclose(result.values, expected)
+    assert (km + lens_m).unit is units.kilometer
+    assert (km * lens_m).unit.components == ("km", "m")
+    assert np.array_equal((5.0 - lens_m).values, [-995.0, -1995.0])
+    with pytest.raises(TypeError):
+        2.0 / lens_m
+
+    # Arrays are combined the same way as single measurements
+    celsius = Unit("°C", "temperature", 1.0, 273.15)
+    temps = MeasurementArray([300.0, 310.0], units.kelvin)
+    for other in (MeasurementArray([1.0, 2.0], celsius), temps):
+        for result, a, b in zip(temps - other, temps, other):
+            assert result.value == pytest.approx((a - b).value)
+
+    # Large arrays give the same results (with `numba`, they use the compiled kernels)
+    big = MeasurementArray(np.arange(10_000.0), "km")
+    assert np.array_equal((big + big).values, np.arange(10_000.0) * 2)
+    assert np.array_equal(big.to("m").values, np.arange(10_000.0) * 1000)
+
 
 def test_mul():
     len1 = Measurement(1.0, units.meter)
     len2 = Measurement(1.0, "m")
 
     mul = len1 * len2
-    assert mul.__str__() == "1.0 m*m"
+    assert mul.__str__() == "1.0 m^2"
+    assert mul.unit is units.meter_squared
 
     area1 = Measurement(1.0, "m2")
     mul = area1 * len1
     assert mul.__str__() == "1.0 m^2*m"
+    assert (area1 * len1).unit is mul.unit
+    assert mul.unit.components == ("m^2", "m") and mul.unit.ops == (MUL,)
+
+    area2 = Measurement(1.0, units.kilometer) * Measurement(2.0, units.kilometer)
+    assert area2.to(units.meter_squared).__str__() == "2000000.0 m^2"
+
+    force = Measurement(2.0, units.kilogram) * Measurement(3.0, "m/s^2")
+    assert force.to("N").__str__() == "6.0 N"
 
     mul = area1 * 1.0
     assert mul.__str__() == "1.0 m^2"
 
     mul = 1.0 * area1
     assert mul.__str__() == "1.0 m^2"
+
+    assert str(Measurement(0.0, "m")) == "0.0 m"
+    assert str(Measurement(-0.0, "m")) == "-0.0 m"
+
+
+def test_pow():
+    volume = Measurement(2.0, units.meter) ** 3
+    assert volume.__str__() == "8.0 m^3"
+    assert volume.unit is units.meter_cubed
+
+    time = Measurement(2.0, units.second) ** 3
+    assert time.__str__() == "8.0 s^3"
+    assert time.unit.components == ("s", "s", "s")
+    assert time.unit.ops == (MUL, MUL)
+    assert (Measurement(1.0, "s") ** 3).unit is time.unit
+
+    # Whole float exponents work the same as `int`s, whichever is used first
+    assert (Measurement(1.0, "s") ** 4.0).unit.components == ("s",) * 4
+    assert (Measurement(1.0, "s") ** 4).unit.ops == (MUL,) * 3
+    with pytest.raises(ValueError):
+        Measurement(1.0, "s") ** 1.5
+
+    # Negative powers are recorded as divisions
+    freq = Measurement(2.0, "s") ** -1
+    assert freq.__str__() == "0.5 s^-1"
+    assert freq.unit.components == ("s", "s", "s")
+    assert freq.unit.ops == (DIV, DIV)
+    assert freq.unit.exp == tuple(-e for e in units.second.exp)
+
+    # Powers of units of different dimensions can't be combined
+    m4, s4 = Measurement(1.0, "m") ** 4, Measurement(1.0, "s") ** 4
+    assert s4.unit.kind == "time^4"
+    with pytest.raises(TypeError):
+        m4 + s4
+    with pytest.raises(TypeError):
+        s4.to(m4.unit)
+
+
+def test_cmp():
+    len1 = Measurement(1.0, units.meter)
+    len2 = Measurement(2.0, "m")
+
+    assert len1 < len2 and len1 <= len2
+    assert len2 > len1 and len2 >= len1
+    assert len1 < 1.5 and len1 >= 1.0
+
+    assert len1 == Measurement(1.0, "meters") and len1 != len2
+    assert len1 != Measurement(1.0, Unit("m", "length", 1.0))
+    assert len1 != "1.0 m"
+    assert len(frozenset((len1, Measurement(1.0, "m"), len2))) == 2
+    assert 1.0 in {len1} and len1 in {1.0}
+    assert {len1: "a"}[1.0] == "a" and {1.0: "a"}[len1] == "a"
+
+    # Measurements of different units aren't ordered
+    assert not Measurement(1.0, units.kilometer) > len1
+
+    # Compound units compare by value, even once the cached unit has been rebuilt
+    s = Measurement(1.0, "s")
+    vol1 = s * s * s
+    units.add_unit(UnitInfo("weird", ["x^2"]), Unit("x^2", "weird", 1.0))
+    vol2 = s * s * s
+    assert vol1.unit is not vol2.unit
+    assert vol1 == vol2 and vol1 <= vol2
+    assert hash(vol1.unit) == hash(vol2.unit)
+
+    # Copies of registered units are the registered units
+    assert copy.deepcopy(len1) == len1
+    assert copy.deepcopy(len1).unit is units.meter
+    assert pickle.loads(pickle.dumps(len1)).unit is units.meter
+    assert pickle.loads(pickle.dumps(vol1)) == vol1
+
+
+def test_measurement_jit():
+    pytest.importorskip("numba")
+    from mun.measurement import MeasurementJIT
+
+    km = MeasurementJIT(1.0, Kilometer.ID)
+    m = MeasurementJIT(1.0, Meter.ID)
+
+    assert (km + m).value == 1.001
+    assert (km + m).unit_idx == Kilometer.ID
+    assert (km - m).value == 0.999
+    assert km.to(Meter.ID).value == 1000.0
+
+    # Units of different dimensions can't be combined
+    hr = MeasurementJIT(1.0, Hour.ID)
+    assert math.isnan((km + hr).value) and math.isnan((km - hr).value)
+    assert math.isnan(km.to(Hour.ID).value)
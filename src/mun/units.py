@@ -1,120 +1,347 @@
 from __future__ import annotations
-from enum import Enum
-from typing import Callable
-from abc import ABC, abstractmethod
-from dataclasses import dataclass
-from typing import override
+import importlib.util
+import re
+import sys
+from collections import ChainMap
+from dataclasses import dataclass, field
+from functools import cache, lru_cache
+from types import MappingProxyType
+from typing import TYPE_CHECKING, Final, Iterable, Iterator
 
+if TYPE_CHECKING:
+    import numpy as np
 
-class UnitOps(Enum):
-    """Represents an operation between units to create compound units."""
 
-    Mul = 0
-    Div = 1
+# The operations between units that create compound units
+MUL: Final[int] = 0
+DIV: Final[int] = 1
 
 
-@dataclass
+@dataclass(frozen=True, slots=True, eq=False)
 class Unit:
     """
     Represents a unit of measure.
 
+    Units compare by value (every field below except `is_linear`), with a shortcut for
+    the same unit. Copying or unpickling a registered unit gives back the registered
+    unit itself.
+
     symbol          - They symbol to display when printing the unit.
     kind            - The kind of measurement (e.g. "length", "time", "mass", etc.)
-    to_base         - A function that takes a `float` value and converts it into the
-                      base unit.
-                      `to_base(value: float) -> float`
-    from_base       - A function that takes a `float` value in the base unit and
-                      converts it into this unit.
-                      `from_base(value: float) -> float`
-    components      - The list of `Unit`s that this unit is composed of. Only valid for
-                      compound units.
+    scale_to_base   - The factor that converts a value in this unit into the base unit:
+                      `base = value * scale_to_base + offset_to_base`
+                      `None` if the unit can't be converted into a base unit.
+    offset_to_base  - The offset added after scaling when converting into the base
+                      unit.
+                      (Defaults to `0.0`)
+    components      - The symbols of the units that this unit is composed of (a tuple).
+                      Only valid for compound units.
                       This is necessary if you wish to simplify or expand `Measurement`s
                       of compound units.
                       (Defaults to `None`)
-    ops             - The list of operations (`UnitOps`) that corresponds to the
-                      `components` list.
+    ops             - The operations (`MUL`/`DIV`) that correspond to the `components`
+                      (a tuple).
                       This defines the relationships between the component units;
                       its length must be 1 less than the length of `components`.
                       (Defaults to `None`)
+    exp             - The exponents of the SI base dimensions (see `DIMS`) of the unit.
+                      Units with the same exponents can be converted into each other,
+                      even if their `kind`s differ.
+                      (Defaults to `None`)
+    idx             - The `ID` of the unit type a built-in unit was created from (an index
+                      into `SCALES`, `OFFSETS`, and `FACTOR_LUT`).
+                      (Defaults to `None`)
+    is_linear       - Whether the unit converts with a scale alone (no offset), so
+                      converting between two linear units is a single multiplication.
+                      (Computed from `scale_to_base` and `offset_to_base`)
     """
 
     symbol: str
     kind: str
-    to_base: Callable | None
-    from_base: Callable | None
-    components: list[str] | None = None
-    ops: list[UnitOps] | None = None
+    scale_to_base: float | None
+    offset_to_base: float = 0.0
+    components: tuple[str, ...] | None = None
+    ops: tuple[int, ...] | None = None
+    exp: tuple[int, ...] | None = None
+    idx: int | None = None
+    is_linear: bool = field(init=False, repr=False)
+    # What `Measurement.__str__` appends to the value
+    _suffix: str = field(init=False, repr=False)
+    _hash: int = field(init=False, repr=False)
+
+    def __post_init__(self):
+        # Symbols and kinds are interned so comparing them is usually a pointer check
+        object.__setattr__(self, "symbol", sys.intern(self.symbol))
+        object.__setattr__(self, "kind", sys.intern(self.kind))
+        object.__setattr__(
+            self,
+            "is_linear",
+            self.scale_to_base is not None and not self.offset_to_base,
+        )
+        object.__setattr__(
+            self, "_suffix", " " + self.symbol if self.symbol else " " + repr(self)
+        )
+        # The components and ops are left out of the hash so it can be computed for
+        # any sequence type
+        object.__setattr__(
+            self,
+            "_hash",
+            hash(
+                (
+                    self.symbol,
+                    self.kind,
+                    self.scale_to_base,
+                    self.offset_to_base,
+                    self.exp,
+                    self.idx,
+                )
+            ),
+        )
+
+    def _fields(self) -> tuple:
+        return (
+            self.symbol,
+            self.kind,
+            self.scale_to_base,
+            self.offset_to_base,
+            self.components,
+            self.ops,
+            self.exp,
+            self.idx,
+        )
+
+    def __eq__(self, other: object) -> bool:
+        if self is other:
+            return True
+        if not isinstance(other, Unit):
+            return NotImplemented
+        return self._hash == other._hash and self._fields() == other._fields()
+
+    def __hash__(self) -> int:
+        return self._hash
+
+    def __reduce__(self):
+        return (_restore_unit, self._fields())
+
+    def __copy__(self) -> Unit:
+        # Units are immutable, so a copy can be the unit itself
+        return self
+
+    def __deepcopy__(self, memo: dict) -> Unit:
+        return self
+
+    def to_base(self, value: float) -> float:
+        """Converts a value in this unit into the base unit."""
+        return value * self.scale_to_base + self.offset_to_base  # type: ignore
+
+    def from_base(self, value: float) -> float:
+        """Converts a value in the base unit into this unit."""
+        return (value - self.offset_to_base) / self.scale_to_base  # type: ignore
+
+
+def _restore_unit(*fields) -> Unit:
+    """
+    Rebuilds a pickled unit: the registered unit with the same symbol if it's equal to
+    the pickled one, otherwise a new unit.
+    """
+    unit = Unit(*fields)
+    registered = Registry._by_name.get(unit.symbol)
+    return registered if registered == unit else unit
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class UnitInfo:
-    """Describes a unit's name and aliases."""
+    """
+    Describes a unit's name and aliases.
+
+    The aliases are stored as a `frozenset`, so duplicates are dropped and membership
+    checks are a single hash lookup.
+    """
 
     name: str
-    aliases: list[str] | None = None
+    aliases: Iterable[str] = field(default=frozenset(), compare=False)
+    _hash: int = field(init=False, repr=False, compare=False)
+
+    def __post_init__(self):
+        # Names are interned so dict lookups by name/alias can compare by identity
+        object.__setattr__(self, "name", sys.intern(self.name))
+        object.__setattr__(
+            self, "aliases", frozenset(sys.intern(a) for a in self.aliases or ())
+        )
+        object.__setattr__(self, "_hash", hash(self.name))
 
     def __hash__(self) -> int:
-        return hash(self.name)
+        return self._hash
+
+
+# Dimensions
+# ================================
+
+# The SI base dimensions, in the order used by exponent vectors: length, mass, time,
+# temperature, amount of substance, electric current, and luminous intensity
+DIMS = ("L", "M", "T", "Θ", "N", "I", "J")
+
+
+def dimensions(**exps: int) -> tuple[int, ...]:
+    """
+    Creates an exponent vector from the exponent of each dimension in `DIMS`.
+
+    # Example
+    ```python
+    dimensions(L=1, T=-2)  # m/s^2
+    ```
+    """
+    unknown = exps.keys() - set(DIMS)
+    if unknown:
+        raise ValueError(f"unknown dimensions: {sorted(unknown)}")
+    return tuple(exps.get(dim, 0) for dim in DIMS)
+
+
+def combine_exp(
+    a: tuple[int, ...], b: tuple[int, ...], power: int = 1
+) -> tuple[int, ...]:
+    """Gets the exponent vector of `a * b**power`."""
+    return tuple(x + power * y for x, y in zip(a, b))
 
 
 # Generic Units
 # ================================
 
 
-class UnitType(ABC):
-    @staticmethod
-    @abstractmethod
-    def to_base(value: float) -> float:
-        return value
+class UnitType:
+    id: UnitInfo
+    ID: int
+    SCALE_TO_BASE: float = 1.0
+    OFFSET_TO_BASE: float = 0.0
+    EXP: tuple[int, ...] | None = None
+    # The `ID`s of the unit types a compound unit is composed of, and the operations
+    # (`MUL`/`DIV`) between them
+    component_ids: tuple[int, ...] | None = None
+    op_bytes: bytes | None = None
+
+    @classmethod
+    def to_base(cls, value: float) -> float:
+        return value * cls.SCALE_TO_BASE + cls.OFFSET_TO_BASE
+
+    @classmethod
+    def from_base(cls, value: float) -> float:
+        return (value - cls.OFFSET_TO_BASE) / cls.SCALE_TO_BASE
+
+    @classmethod
+    def to_base_array(
+        cls, values: np.ndarray, out: np.ndarray | None = None
+    ) -> np.ndarray:
+        """
+        Converts an array of values into the base unit.
 
-    @staticmethod
-    @abstractmethod
-    def from_base(value: float) -> float:
-        return value
+        The result is written to `out` if it is given (e.g. `out=values` converts in
+        place).
 
+        # Note
+        Requires `numpy`.
+        """
+        import numpy as np
 
-class BaseUnitType(UnitType):
-    @override
-    @staticmethod
-    def to_base(value: float) -> float:
-        return value
+        out = np.multiply(values, cls.SCALE_TO_BASE, out=out)
+        if cls.OFFSET_TO_BASE:
+            out += cls.OFFSET_TO_BASE
+        return out
 
-    @override
-    @staticmethod
-    def from_base(value: float) -> float:
-        return value
+    @classmethod
+    def from_base_array(
+        cls, values: np.ndarray, out: np.ndarray | None = None
+    ) -> np.ndarray:
+        """
+        Converts an array of values in the base unit into this unit.
 
+        The result is written to `out` if it is given (e.g. `out=values` converts in
+        place).
+
+        # Note
+        Requires `numpy`.
+        """
+        import numpy as np
+
+        if cls.OFFSET_TO_BASE:
+            out = np.subtract(values, cls.OFFSET_TO_BASE, out=out)
+            out /= cls.SCALE_TO_BASE
+            return out
+        return np.divide(values, cls.SCALE_TO_BASE, out=out)
+
+
+class BaseUnitType(UnitType):
+    SCALE_TO_BASE: float = 1.0
 
-class KiloUnitType(UnitType):
-    @override
-    @staticmethod
-    def to_base(value: float) -> float:
-        return value * 1000
 
-    @override
-    @staticmethod
-    def from_base(value: float) -> float:
-        return value / 1000
+class KiloUnitType(UnitType):
+    SCALE_TO_BASE: float = 1000.0
 
 
 class MiliUnitType(UnitType):
-    @override
-    @staticmethod
-    def to_base(value: float) -> float:
-        return value / 1000
+    SCALE_TO_BASE: float = 0.001
+
 
-    @override
-    @staticmethod
-    def from_base(value: float) -> float:
-        return value * 1000
+# Unit types created by `_unit_type`, indexed by their `ID`
+_UNIT_TYPES: list[type[UnitType]] = []
+
+# Maps the name and aliases of each unit type created by `_unit_type` to the type
+_ALIASES: dict[str, type[UnitType]] = {}
+
+
+def _unit_type(
+    pyname: str,
+    base: type[UnitType],
+    id: UnitInfo,
+    exp: tuple[int, ...],
+    scale: float | None = None,
+    components: list[str] | None = None,
+    ops: list[int] | None = None,
+) -> type[UnitType]:
+    """
+    Creates a unit type named `pyname` that derives from `base`, and assigns it the
+    next `ID`.
+
+    `components` are the names/aliases of previously created unit types. The scale
+    of a compound unit defaults to the product of its component scales, otherwise it
+    defaults to the one of `base`.
+    """
+    namespace: dict = {
+        "__module__": __name__,
+        "id": id,
+        "ID": len(_UNIT_TYPES),
+        "EXP": exp,
+    }
+    if components is not None:
+        component_ids = tuple(_ALIASES[c].ID for c in components)
+        namespace["component_ids"] = component_ids
+        namespace["op_bytes"] = bytes(ops or ())
+
+        if scale is None:
+            # Multiply the component scales out once so conversions are one multiply
+            scale = _UNIT_TYPES[component_ids[0]].SCALE_TO_BASE
+            for op, i in zip(ops or (), component_ids[1:]):
+                if op == MUL:
+                    scale *= _UNIT_TYPES[i].SCALE_TO_BASE
+                else:
+                    scale /= _UNIT_TYPES[i].SCALE_TO_BASE
+    if scale is not None:
+        namespace["SCALE_TO_BASE"] = scale
+
+    cls = type(pyname, (base,), namespace)
+    _UNIT_TYPES.append(cls)
+    _ALIASES[id.name] = cls
+    for alias in id.aliases:
+        _ALIASES[alias] = cls
+    return cls
 
 
 # Length Units
 # ================================
 
-
-class Meter(BaseUnitType):
-    id: UnitInfo = UnitInfo(
+Meter = _unit_type(
+    "Meter",
+    BaseUnitType,
+    UnitInfo(
         "meter",
         [
             "m",
@@ -126,11 +353,14 @@ class Meter(BaseUnitType):
             "Metre",
             "Metres",
         ],
-    )
-
-
-class Kilometer(KiloUnitType):
-    id: UnitInfo = UnitInfo(
+    ),
+    exp=dimensions(L=1),
+)
+
+Kilometer = _unit_type(
+    "Kilometer",
+    KiloUnitType,
+    UnitInfo(
         "kilometer",
         [
             "km",
@@ -141,15 +371,18 @@ class Kilometer(KiloUnitType):
             "Kilometre",
             "Kilometres",
         ],
-    )
+    ),
+    exp=dimensions(L=1),
+)
 
 
 # Time Units
 # ================================
 
-
-class Second(BaseUnitType):
-    id: UnitInfo = UnitInfo(
+Second = _unit_type(
+    "Second",
+    BaseUnitType,
+    UnitInfo(
         "second",
         [
             "s",
@@ -161,11 +394,14 @@ class Second(BaseUnitType):
             "Second",
             "Seconds",
         ],
-    )
-
-
-class Minute(UnitType):
-    id: UnitInfo = UnitInfo(
+    ),
+    exp=dimensions(T=1),
+)
+
+Minute = _unit_type(
+    "Minute",
+    UnitType,
+    UnitInfo(
         "minute",
         [
             "min",
@@ -175,21 +411,15 @@ class Minute(UnitType):
             "Mins",
             "Minutes",
         ],
-    )
-
-    @override
-    @staticmethod
-    def to_base(value: float) -> float:
-        return value * 60
-
-    @override
-    @staticmethod
-    def from_base(value: float) -> float:
-        return value / 60
-
-
-class Hour(UnitType):
-    id: UnitInfo = UnitInfo(
+    ),
+    exp=dimensions(T=1),
+    scale=60.0,
+)
+
+Hour = _unit_type(
+    "Hour",
+    UnitType,
+    UnitInfo(
         "hour",
         [
             "h",
@@ -199,25 +429,19 @@ class Hour(UnitType):
             "Hour",
             "Hours",
         ],
-    )
-
-    @override
-    @staticmethod
-    def to_base(value: float) -> float:
-        return value * 3600
-
-    @override
-    @staticmethod
-    def from_base(value: float) -> float:
-        return value / 3600
+    ),
+    exp=dimensions(T=1),
+    scale=3600.0,
+)
 
 
 # Mass Units
 # ================================
 
-
-class Gram(BaseUnitType):
-    id: UnitInfo = UnitInfo(
+Gram = _unit_type(
+    "Gram",
+    MiliUnitType,
+    UnitInfo(
         "gram",
         [
             "g",
@@ -225,11 +449,14 @@ class Gram(BaseUnitType):
             "Gram",
             "Grams",
         ],
-    )
-
-
-class Kilogram(KiloUnitType):
-    id: UnitInfo = UnitInfo(
+    ),
+    exp=dimensions(M=1),
+)
+
+Kilogram = _unit_type(
+    "Kilogram",
+    BaseUnitType,
+    UnitInfo(
         "kilogram",
         [
             "kg",
@@ -237,15 +464,18 @@ class Kilogram(KiloUnitType):
             "Kilogram",
             "Kilograms",
         ],
-    )
+    ),
+    exp=dimensions(M=1),
+)
 
 
 # Area Units
 # ================================
 
-
-class MeterSquared(BaseUnitType):
-    id: UnitInfo = UnitInfo(
+MeterSquared = _unit_type(
+    "MeterSquared",
+    BaseUnitType,
+    UnitInfo(
         "meter squared",
         [
             "m*m",
@@ -258,14 +488,16 @@ class MeterSquared(BaseUnitType):
             "Metre Squared",
             "Metres Squared",
         ],
-    )
-
-    components: list[str] = ["m", "m"]
-    ops: list[UnitOps] = [UnitOps.Mul]
-
-
-class KilometerSquared(KiloUnitType):
-    id: UnitInfo = UnitInfo(
+    ),
+    exp=dimensions(L=2),
+    components=["m", "m"],
+    ops=[MUL],
+)
+
+KilometerSquared = _unit_type(
+    "KilometerSquared",
+    KiloUnitType,
+    UnitInfo(
         "kilometer squared",
         [
             "km*km",
@@ -278,18 +510,20 @@ class KilometerSquared(KiloUnitType):
             "Kilometre Squared",
             "Kilometres Squared",
         ],
-    )
-
-    components: list[str] = ["km", "km"]
-    ops: list[UnitOps] = [UnitOps.Mul]
+    ),
+    exp=dimensions(L=2),
+    components=["km", "km"],
+    ops=[MUL],
+)
 
 
 # Volume Units
 # ================================
 
-
-class MeterCubed(BaseUnitType):
-    id: UnitInfo = UnitInfo(
+MeterCubed = _unit_type(
+    "MeterCubed",
+    BaseUnitType,
+    UnitInfo(
         "meter cubed",
         [
             "m*m*m",
@@ -302,22 +536,20 @@ class MeterCubed(BaseUnitType):
             "Metre Cubed",
             "Metres Cubed",
         ],
-    )
-
-    components: list[str] = [
-        "m",
-        "m",
-        "m",
-    ]
-    ops: list[UnitOps] = [UnitOps.Mul, UnitOps.Mul]
+    ),
+    exp=dimensions(L=3),
+    components=["m", "m", "m"],
+    ops=[MUL, MUL],
+)
 
 
 # Velocity Units
 # ================================
 
-
-class MeterPerSecond(BaseUnitType):
-    id: UnitInfo = UnitInfo(
+MeterPerSecond = _unit_type(
+    "MeterPerSecond",
+    BaseUnitType,
+    UnitInfo(
         "meter per second",
         [
             "m/s",
@@ -330,21 +562,20 @@ class MeterPerSecond(BaseUnitType):
             "Metres Per Second",
             "Meters Per Second",
         ],
-    )
-
-    components: list[str] = [
-        "m",
-        "s",
-    ]
-    ops: list[UnitOps] = [UnitOps.Div]
+    ),
+    exp=dimensions(L=1, T=-1),
+    components=["m", "s"],
+    ops=[DIV],
+)
 
 
 # Acceleration Units
 # ================================
 
-
-class MeterPerSecondSquared(BaseUnitType):
-    id: UnitInfo = UnitInfo(
+MeterPerSecondSquared = _unit_type(
+    "MeterPerSecondSquared",
+    BaseUnitType,
+    UnitInfo(
         "meter per second squared",
         [
             "m/s^2",
@@ -358,22 +589,20 @@ class MeterPerSecondSquared(BaseUnitType):
             "Metres Per Second Squared",
             "Meters Per Second Squared",
         ],
-    )
-
-    components: list[str] = [
-        "m",
-        "s",
-        "s",
-    ]
-    ops: list[UnitOps] = [UnitOps.Div, UnitOps.Div]
+    ),
+    exp=dimensions(L=1, T=-2),
+    components=["m", "s", "s"],
+    ops=[DIV, DIV],
+)
 
 
 # Force Units
 # ================================
 
-
-class Newton(BaseUnitType):
-    id: UnitInfo = UnitInfo(
+Newton = _unit_type(
+    "Newton",
+    BaseUnitType,
+    UnitInfo(
         "newton",
         [
             "N",
@@ -384,19 +613,19 @@ class Newton(BaseUnitType):
             "kg*m/s/s",
             "kg*m/s**2",
         ],
-    )
-
-    components: list[str] = [
-        "kg",
-        "m/s^2",
-    ]
-    ops: list[UnitOps] = [UnitOps.Mul]
+    ),
+    exp=dimensions(L=1, M=1, T=-2),
+    components=["kg", "m/s^2"],
+    ops=[MUL],
+)
 
 
 # Pressure Units
 # ================================
-class Pascal(BaseUnitType):
-    id: UnitInfo = UnitInfo(
+Pascal = _unit_type(
+    "Pascal",
+    BaseUnitType,
+    UnitInfo(
         "pascal",
         [
             "Pa",
@@ -407,19 +636,19 @@ class Pascal(BaseUnitType):
             "N/m/m",
             "N/m**2",
         ],
-    )
-
-    components: list[str] = [
-        "N",
-        "m^2",
-    ]
-    ops: list[UnitOps] = [UnitOps.Div]
+    ),
+    exp=dimensions(L=-1, M=1, T=-2),
+    components=["N", "m^2"],
+    ops=[DIV],
+)
 
 
 # Temperature Units
 # ================================
-class Kelvin(BaseUnitType):
-    id: UnitInfo = UnitInfo(
+Kelvin = _unit_type(
+    "Kelvin",
+    BaseUnitType,
+    UnitInfo(
         "kelvin",
         [
             "K",
@@ -427,13 +656,17 @@ class Kelvin(BaseUnitType):
             "kelvins",
             "Kelvins",
         ],
-    )
+    ),
+    exp=dimensions(Θ=1),
+)
 
 
 # Density Units
 # ================================
-class KilogramPerMeterCubed(BaseUnitType):
-    id: UnitInfo = UnitInfo(
+KilogramPerMeterCubed = _unit_type(
+    "KilogramPerMeterCubed",
+    BaseUnitType,
+    UnitInfo(
         "kilogram per meter cubed",
         [
             "kg/m^3",
@@ -443,19 +676,19 @@ class KilogramPerMeterCubed(BaseUnitType):
             "Kilogram Per Meter Cubed",
             "Kilograms Per Meter Cubed",
         ],
-    )
-
-    components: list[str] = [
-        "kg",
-        "m^3",
-    ]
-    ops: list[UnitOps] = [UnitOps.Div]
+    ),
+    exp=dimensions(L=-3, M=1),
+    components=["kg", "m^3"],
+    ops=[DIV],
+)
 
 
 # Viscosity Units
 # ================================
-class MeterSquaredPerSecond(BaseUnitType):
-    id: UnitInfo = UnitInfo(
+MeterSquaredPerSecond = _unit_type(
+    "MeterSquaredPerSecond",
+    BaseUnitType,
+    UnitInfo(
         "meter squared per second",
         [
             "m^2/s",
@@ -467,13 +700,124 @@ class MeterSquaredPerSecond(BaseUnitType):
             "Metre Squared Per Second",
             "Metres Squared Per Second",
         ],
+    ),
+    exp=dimensions(L=2, T=-1),
+    components=["m^2", "s"],
+    ops=[DIV],
+)
+
+
+@cache
+def _load_fastpath():
+    """
+    Imports the compiled kernels on first use, since importing `numba` is slow.
+
+    Returns `None` if `numba` isn't installed.
+    """
+    if importlib.util.find_spec("numba") is None:
+        return None
+
+    from mun import _fastpath
+
+    return _fastpath if _fastpath.HAS_NUMBA else None
+
+
+def convert_array(
+    values: np.ndarray, src: Unit, dst: Unit, out: np.ndarray | None = None
+) -> np.ndarray:
+    """
+    Converts an array of values in `src` into `dst`, using a single buffer for the
+    intermediate results.
+
+    The result is written to `out` if it is given (e.g. `out=values` converts in
+    place).
+
+    # Note
+    Requires `numpy`, and both units must have a `scale_to_base` defined.
+    Contiguous arrays are converted with a compiled kernel if `numba` is installed.
+    """
+    fastpath = _load_fastpath()
+    if (
+        fastpath is not None
+        and values.flags.c_contiguous
+        and (out is None or out.flags.c_contiguous)
+    ):
+        return fastpath.affine(values, *get_conversion(src, dst), out)
+
+    import numpy as np
+
+    scale, offset = get_conversion(src, dst)
+    out = np.multiply(values, scale, out=out)
+    if offset:
+        out += offset
+    return out
+
+
+@lru_cache(maxsize=1024)
+def get_factor(src: Unit, dst: Unit) -> float:
+    """
+    Gets the factor that converts a value in `src` into `dst`.
+
+    The factor is computed once per pair of units and cached (for the 1024 most
+    recently used pairs).
+
+    # Note
+    Both units must have a `scale_to_base` defined, and the factor ignores any
+    `offset_to_base`.
+    """
+    return src.scale_to_base / dst.scale_to_base  # type: ignore
+
+
+@lru_cache(maxsize=1024)
+def get_conversion(src: Unit, dst: Unit) -> tuple[float, float]:
+    """
+    Gets the `(scale, offset)` that converts a value in `src` into `dst`:
+    `value * scale + offset`.
+
+    The conversion is computed once per pair of units and cached (for the 1024 most
+    recently used pairs).
+
+    # Note
+    Both units must have a `scale_to_base` defined.
+    """
+    return (
+        src.scale_to_base / dst.scale_to_base,  # type: ignore
+        (src.offset_to_base - dst.offset_to_base) / dst.scale_to_base,  # type: ignore
     )
 
-    components: list[str] = [
-        "m^2",
-        "s",
-    ]
-    ops: list[UnitOps] = [UnitOps.Div]
+
+# The built-in units: their unit type, symbol, and kind
+_UNIT_ROWS: Final[tuple[tuple[type[UnitType], str, str], ...]] = (
+    # Length
+    (Meter, "m", "length"),
+    (Kilometer, "km", "length"),
+    # Time
+    (Second, "s", "time"),
+    (Minute, "min", "time"),
+    (Hour, "hr", "time"),
+    # Mass
+    (Gram, "g", "mass"),
+    (Kilogram, "kg", "mass"),
+    # Area
+    (MeterSquared, "m^2", "area"),
+    (KilometerSquared, "km^2", "area"),
+    # Volume
+    (MeterCubed, "m^3", "volume"),
+    # Velocity
+    (MeterPerSecond, "m/s", "velocity"),
+    # Acceleration
+    (MeterPerSecondSquared, "m/s^2", "acceleration"),
+    # Force
+    (Newton, "N", "force"),
+    # Pressure
+    (Pascal, "Pa", "pressure"),
+    # Temperature
+    (Kelvin, "K", "temperature"),
+    # Density
+    (KilogramPerMeterCubed, "kg/m^3", "density"),
+    # Viscosity
+    (MeterSquaredPerSecond, "m^2/s", "viscosity"),
+)
 
 
 class Registry:
@@ -486,60 +830,45 @@ class Registry:
     Only one registry should be used at a time.
     """
 
-    # The registered units
-    units: dict[UnitInfo, Unit] = {
-        # Length
-        Meter.id: Unit("m", "length", Meter.to_base, Meter.from_base),
-        Kilometer.id: Unit("km", "length", Kilometer.to_base, Kilometer.from_base),
-        # Time
-        Second.id: Unit("s", "time", Second.to_base, Second.from_base),
-        Minute.id: Unit("min", "time", Minute.to_base, Minute.from_base),
-        Hour.id: Unit("hr", "time", Hour.to_base, Hour.from_base),
-        # Mass
-        Gram.id: Unit("g", "mass", Gram.to_base, Gram.from_base),
-        Kilogram.id: Unit("kg", "mass", Kilogram.to_base, Kilogram.from_base),
-        # Area
-        MeterSquared.id: Unit(
-            "m^2", "area", MeterSquared.to_base, MeterSquared.from_base
-        ),
-        KilometerSquared.id: Unit(
-            "km^2", "area", KilometerSquared.to_base, KilometerSquared.from_base
-        ),
-        # Volume
-        MeterCubed.id: Unit("m^3", "volume", MeterCubed.to_base, MeterCubed.from_base),
-        # Velocity
-        MeterPerSecond.id: Unit(
-            "m/s", "velocity", MeterPerSecond.to_base, MeterPerSecond.from_base
-        ),
-        # Acceleration
-        MeterPerSecondSquared.id: Unit(
-            "m/s^2",
-            "acceleration",
-            MeterPerSecondSquared.to_base,
-            MeterPerSecondSquared.from_base,
-        ),
-        # Force
-        Newton.id: Unit("N", "force", Newton.to_base, Newton.from_base),
-        # Pressure
-        Pascal.id: Unit("Pa", "pressure", Pascal.to_base, Pascal.from_base),
-        # Temperature
-        Kelvin.id: Unit("K", "temperature", Kelvin.to_base, Kelvin.from_base),
-        # Density
-        KilogramPerMeterCubed.id: Unit(
-            "kg/m^3",
-            "density",
-            KilogramPerMeterCubed.to_base,
-            KilogramPerMeterCubed.from_base,
-        ),
-        # Viscosity
-        MeterSquaredPerSecond.id: Unit(
-            "m^2/s",
-            "viscosity",
-            MeterSquaredPerSecond.to_base,
-            MeterSquaredPerSecond.from_base,
-        ),
+    # All state lives on the class, so instances don't need a `__dict__`: attribute
+    # lookups like `ureg.meter` then skip the instance dictionary entirely
+    __slots__ = ()
+
+    # The built-in units, keyed by name, which are never modified
+    _builtin_units: MappingProxyType[str, Unit] = MappingProxyType(
+        {
+            cls.id.name: Unit(
+                symbol,
+                kind,
+                cls.SCALE_TO_BASE,
+                cls.OFFSET_TO_BASE,
+                exp=cls.EXP,
+                idx=cls.ID,
+            )
+            for cls, symbol, kind in _UNIT_ROWS
+        }
+    )
+
+    # The units registered with `add_unit`
+    _user_units: dict[str, Unit] = {}
+
+    # The registered units, keyed by name: custom units shadow built-in units with the
+    # same name
+    units: ChainMap[str, Unit] = ChainMap(_user_units, _builtin_units)  # type: ignore
+
+    # Maps the name and every alias of a registered unit to the unit itself
+    _by_name: dict[str, Unit] = {
+        key: unit
+        for (cls, _, _), unit in zip(_UNIT_ROWS, _builtin_units.values())
+        for key in (cls.id.name, *cls.id.aliases)
     }
 
+    def lookup(self, symbol: str) -> Unit | None:
+        """
+        Gets the registered unit with the given name or alias, or `None` if there isn't one.
+        """
+        return Registry._by_name.get(symbol)
+
     def add_unit(self, id: UnitInfo, unit: Unit):
         """
         Adds a custom unit to the registry.
@@ -566,119 +895,330 @@ class Registry:
                 ],
             )
 
-        units.add_unit(Meter.id, Unit("m", "length", Meter.to_base, Meter.from_base))
+        units.add_unit(Meter.id, Unit("m", "length", Meter.SCALE_TO_BASE))
         ```
         """
-        Registry.units[id] = unit
+        # Keep the named attributes (e.g. `ureg.meter`) pointing at the registered unit
+        previous = Registry.units.get(id.name)
+        if previous is not None:
+            for name, value in list(vars(Registry).items()):
+                if value is previous:
+                    setattr(Registry, name, unit)
+
+        Registry._user_units[id.name] = unit
+        Registry._by_name[id.name] = unit
+        for alias in id.aliases:
+            Registry._by_name[alias] = unit
+
+        # Derived units may now resolve to the new unit, but only if it's named like one
+        # (i.e. `*`, `/`, or `^` appears in its name or aliases)
+        if any(op in key for key in (id.name, *id.aliases) for op in "*/^"):
+            _mul_unit.cache_clear()
+            _div_unit.cache_clear()
+            _int_pow_unit.cache_clear()
 
     # Length
     # ================================================================
-    @property
-    def meter(self) -> Unit:
-        """Represents a meter."""
-        return self.units[Meter.id]
-
-    @property
-    def kilometer(self) -> Unit:
-        """Represents a Kilometer."""
-        return self.units[Kilometer.id]
+    # Represents a meter
+    meter: Unit = _builtin_units[Meter.id.name]
+    # Represents a Kilometer
+    kilometer: Unit = _builtin_units[Kilometer.id.name]
 
     # Time
     # ================================================================
-    @property
-    def second(self) -> Unit:
-        """Represents a second."""
-        return self.units[Second.id]
-
-    @property
-    def minute(self) -> Unit:
-        """Represents a minute."""
-        return self.units[Minute.id]
-
-    @property
-    def hour(self) -> Unit:
-        """Represents an hour."""
-        return self.units[Hour.id]
+    # Represents a second
+    second: Unit = _builtin_units[Second.id.name]
+    # Represents a minute
+    minute: Unit = _builtin_units[Minute.id.name]
+    # Represents an hour
+    hour: Unit = _builtin_units[Hour.id.name]
 
     # Mass
     # ================================================================
-    @property
-    def gram(self) -> Unit:
-        """Represents a gram."""
-        return self.units[Gram.id]
-
-    @property
-    def kilogram(self) -> Unit:
-        """Represents a kilogram."""
-        return self.units[Kilogram.id]
+    # Represents a gram
+    gram: Unit = _builtin_units[Gram.id.name]
+    # Represents a kilogram
+    kilogram: Unit = _builtin_units[Kilogram.id.name]
 
     # Area
     # ================================================================
-    @property
-    def meter_squared(self) -> Unit:
-        """Represents a `m^2`."""
-        return self.units[MeterSquared.id]
-
-    @property
-    def kilometer_squared(self) -> Unit:
-        """Represents a `km^2`."""
-        return self.units[KilometerSquared.id]
+    # Represents a `m^2`
+    meter_squared: Unit = _builtin_units[MeterSquared.id.name]
+    # Represents a `km^2`
+    kilometer_squared: Unit = _builtin_units[KilometerSquared.id.name]
 
     # Volume
     # ================================================================
-    @property
-    def meter_cubed(self) -> Unit:
-        """Represents a `m^3`."""
-        return self.units[MeterCubed.id]
+    # Represents a `m^3`
+    meter_cubed: Unit = _builtin_units[MeterCubed.id.name]
 
     # Velocity
     # ================================================================
-    @property
-    def meter_per_second(self) -> Unit:
-        """Represents a `m/s`."""
-        return self.units[MeterPerSecond.id]
+    # Represents a `m/s`
+    meter_per_second: Unit = _builtin_units[MeterPerSecond.id.name]
 
     # Acceleration
     # ================================================================
-    @property
-    def meter_per_second_squared(self) -> Unit:
-        """Represents a `m/s^2`."""
-        return self.units[MeterPerSecondSquared.id]
+    # Represents a `m/s^2`
+    meter_per_second_squared: Unit = _builtin_units[MeterPerSecondSquared.id.name]
 
     # Force
     # ================================================================
-    @property
-    def newton(self) -> Unit:
-        """Represents a Newton."""
-        return self.units[Newton.id]
+    # Represents a Newton
+    newton: Unit = _builtin_units[Newton.id.name]
 
     # Pressure
     # ================================================================
-    @property
-    def pascal(self) -> Unit:
-        """Represents a Pascal."""
-        return self.units[Pascal.id]
+    # Represents a Pascal
+    pascal: Unit = _builtin_units[Pascal.id.name]
 
     # Temperature
     # ================================================================
-    @property
-    def kelvin(self) -> Unit:
-        """Represents a Kelvin."""
-        return self.units[Kelvin.id]
+    # Represents a Kelvin
+    kelvin: Unit = _builtin_units[Kelvin.id.name]
 
     # Density
     # ================================================================
-    @property
-    def kilogram_per_meter_cubed(self) -> Unit:
-        """Represents a `kg/m^3`."""
-        return self.units[KilogramPerMeterCubed.id]
+    # Represents a `kg/m^3`
+    kilogram_per_meter_cubed: Unit = _builtin_units[KilogramPerMeterCubed.id.name]
 
     # Viscosity
     # ================================================================
-    @property
-    def meter_squared_per_second(self) -> Unit:
-        """Represents a `m^2/s`."""
-        return self.units[MeterSquaredPerSecond.id]
+    # Represents a `m^2/s`
+    meter_squared_per_second: Unit = _builtin_units[MeterSquaredPerSecond.id.name]
 
 
 ureg = Registry()
+
+
+def _compound_scale(a: Unit, b: Unit, power: int) -> float | None:
+    """
+    Gets the `scale_to_base` of `a * b**power`, or `None` if either unit can't be
+    converted with a scale alone.
+    """
+    if (
+        a.scale_to_base is None
+        or b.scale_to_base is None
+        or a.offset_to_base
+        or b.offset_to_base
+    ):
+        return None
+    return a.scale_to_base * b.scale_to_base**power
+
+
+def _compound_exp(a: Unit, b: Unit, power: int) -> tuple[int, ...] | None:
+    """Gets the `exp` of `a * b**power`, or `None` if either unit has no `exp`."""
+    if a.exp is None or b.exp is None:
+        return None
+    return combine_exp(a.exp, b.exp, power)
+
+
+@lru_cache(maxsize=1024)
+def _mul_unit(a: Unit, b: Unit) -> Unit:
+    """
+    Gets the unit of `a * b`: the registered unit with its symbol if there is one,
+    otherwise a new compound unit.
+    """
+    symbol = f"{a.symbol}*{b.symbol}"
+    unit = ureg.lookup(symbol)
+
+    # Create new unit if one doesn't exist
+    if unit is None:
+        unit = Unit(
+            symbol=symbol,
+            kind=f"{a.kind}*{b.kind}",
+            scale_to_base=_compound_scale(a, b, 1),
+            components=(a.symbol, b.symbol),
+            ops=(MUL,),
+            exp=_compound_exp(a, b, 1),
+        )
+    return unit
+
+
+@lru_cache(maxsize=1024)
+def _div_unit(a: Unit, b: Unit) -> Unit:
+    """
+    Gets the unit of `a / b`: the registered unit with its symbol if there is one,
+    otherwise a new compound unit.
+    """
+    symbol = f"{a.symbol}/{b.symbol}"
+    unit = ureg.lookup(symbol)
+
+    # Create new unit if one doesn't exist
+    if unit is None:
+        unit = Unit(
+            symbol=symbol,
+            kind=f"{a.kind}/{b.kind}",
+            scale_to_base=_compound_scale(a, b, -1),
+            components=(a.symbol, b.symbol),
+            ops=(DIV,),
+            exp=_compound_exp(a, b, -1),
+        )
+    return unit
+
+
+def _pow_unit(a: Unit, exp: int) -> Unit:
+    """
+    Gets the unit of `a**exp`: the registered unit with its symbol if there is one,
+    otherwise a new compound unit.
+
+    Raises a `ValueError` if `exp` isn't a whole number.
+    """
+    # `2` and `2.0` share a cache entry, so the exponent is made an `int` beforehand
+    n = int(exp)
+    if n != exp:
+        raise ValueError(f"units can only be raised to whole powers, not {exp!r}")
+    return _int_pow_unit(a, n)
+
+
+@lru_cache(maxsize=1024)
+def _int_pow_unit(a: Unit, exp: int) -> Unit:
+    """Gets the unit of `a**exp` for an `int` exponent (see `_pow_unit`)."""
+    symbol = f"{a.symbol}^{exp}"
+    unit = ureg.lookup(symbol)
+
+    # Create new unit if one doesn't exist
+    if unit is None:
+        if exp > 0:
+            components = (a.symbol,) * exp
+            ops = (MUL,) * (exp - 1)
+        else:
+            # Components can't be divided into 1, so `a` is divided by itself instead:
+            # `a^-1` is `a/a/a` (and `a^0` is `a/a`)
+            components = (a.symbol,) * (2 - exp)
+            ops = (DIV,) * (1 - exp)
+        unit = Unit(
+            symbol=symbol,
+            kind=f"{a.kind}^{exp}",
+            scale_to_base=None
+            if a.scale_to_base is None or a.offset_to_base
+            else a.scale_to_base**exp,
+            components=components,
+            ops=ops,
+            exp=None if a.exp is None else tuple(e * exp for e in a.exp),
+        )
+    return unit
+
+
+# Maps every unit name and alias to its unit type
+ALIAS_TABLE: MappingProxyType[str, type[UnitType]] = MappingProxyType(_ALIASES)
+
+
+def lookup(name: str) -> type[UnitType]:
+    """
+    Gets the unit type with the given name or alias.
+
+    # Note
+    Only unit types defined in this module are included; raises a `KeyError` for
+    unknown names.
+    """
+    return ALIAS_TABLE[name]
+
+
+@cache
+def _alias_regex() -> re.Pattern[str]:
+    # Matches any unit name or alias that isn't part of a longer word; longer aliases
+    # are tried first so e.g. "m/s^2" wins over "m"
+    return re.compile(
+        r"(?<![^\W\d_])("
+        + "|".join(map(re.escape, sorted(ALIAS_TABLE, key=len, reverse=True)))
+        + r")(?![^\W\d_])"
+    )
+
+
+@cache
+def _scale_tables() -> tuple[np.ndarray, np.ndarray]:
+    """
+    Gets the `SCALE_TO_BASE`s and `OFFSET_TO_BASE`s of every unit type, indexed by
+    their `ID`s.
+    """
+    import numpy as np
+
+    scales = np.array([cls.SCALE_TO_BASE for cls in _UNIT_TYPES], dtype=np.float64)
+    offsets = np.array([cls.OFFSET_TO_BASE for cls in _UNIT_TYPES], dtype=np.float64)
+    scales.flags.writeable = False
+    offsets.flags.writeable = False
+    return scales, offsets
+
+
+@cache
+def _factor_table() -> np.ndarray:
+    """
+    Gets the conversion factors between every pair of unit types, indexed by their
+    `ID`s: `factors[src, dst]` converts a value in `src` into `dst`.
+
+    Pairs involving a unit type with an offset, and pairs of unit types with different
+    dimensions, are `nan`.
+    """
+    import numpy as np
+
+    scales, offsets = _scale_tables()
+    factors = scales[:, None] / scales[None, :]
+
+    # A unit with an offset can't be converted with a factor alone
+    affine = offsets != 0.0
+    factors[affine, :] = float("nan")
+    factors[:, affine] = float("nan")
+
+    # Nor can units of different dimensions be converted at all
+    exps = [cls.EXP for cls in _UNIT_TYPES]
+    incompatible = np.array([[a is None or a != b for b in exps] for a in exps])
+    factors[incompatible] = float("nan")
+    factors.flags.writeable = False
+    return factors
+
+
+def to_base_batch(values: np.ndarray, unit_ids: np.ndarray) -> np.ndarray:
+    """
+    Converts an array of values, each in the unit type whose `ID` is at the same index
+    in `unit_ids`, into their base units.
+
+    # Note
+    Requires `numpy`.
+    """
+    scales, offsets = _scale_tables()
+    return values * scales[unit_ids] + offsets[unit_ids]
+
+
+def convert_batch(
+    values: np.ndarray, src_ids: np.ndarray, dst_ids: np.ndarray
+) -> np.ndarray:
+    """
+    Converts an array of values, each from the unit type whose `ID` is at the same index
+    in `src_ids` into the one in `dst_ids`, with a single lookup into `FACTOR_LUT`.
+
+    # Note
+    Requires `numpy`. Conversions involving a unit type with an offset, or between unit
+    types of different dimensions, give `nan`.
+    """
+    return values * _factor_table()[src_ids, dst_ids]
+
+
+def __getattr__(name: str):
+    # `ALIAS_REGEX`, `SCALES`, `OFFSETS`, and `FACTOR_LUT` are only built when they're
+    # first used
+    if name == "ALIAS_REGEX":
+        return _alias_regex()
+    if name == "SCALES":
+        return _scale_tables()[0]
+    if name == "OFFSETS":
+        return _scale_tables()[1]
+    if name == "FACTOR_LUT":
+        return _factor_table()
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
+def find_units(text: str) -> Iterator[tuple[str, type[UnitType]]]:
+    """
+    Finds every unit name or alias in `text`, in a single pass.
+
+    Yields the matched name/alias and its unit type.
+
+    # Example
+    ```python
+    list(find_units("9.8 m/s^2"))  # [("m/s^2", MeterPerSecondSquared)]
+    ```
+    """
+    for match in _alias_regex().finditer(text):
+        alias = match.group(1)
+        yield alias, ALIAS_TABLE[alias]